@@ -1,3 +1,4 @@
+import random
 import sys
 import pygame
 
@@ -18,4 +19,107 @@ LINE_WIDTH = 15
 FIGURE_WIDTH = 15
 FIGURE_PADDING = 30
 PLAYER_X = 1
-PLAYER_O = 2
\ No newline at end of file
+PLAYER_O = 2
+WIN_MASKS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+
+CELL_LINES = tuple(
+    tuple(w for w in WIN_MASKS if w & (1 << i)) for i in range(BOARD_ROWS * BOARD_COLS)
+)
+
+
+def _make_win_checker(lines):
+    src = "def check(mask):\n    return " + " or ".join(
+        f"(mask & {w}) == {w}" for w in lines
+    )
+    namespace = {}
+    exec(src, namespace)
+    return namespace["check"]
+
+
+_WIN_CHECKERS = tuple(_make_win_checker(lines) for lines in CELL_LINES)
+_check_any_line = _make_win_checker(WIN_MASKS)
+
+_rng = random.Random(0x5EED)
+_ZOBRIST = [[_rng.getrandbits(64) for _ in range(2)] for _ in range(BOARD_ROWS * BOARD_COLS)]
+
+
+class Board:
+    __slots__ = ("x_mask", "o_mask", "marked_squares", "zobrist")
+
+    def __init__(self):
+        self.x_mask = 0
+        self.o_mask = 0
+        self.marked_squares = 0
+        self.zobrist = 0
+
+    def mark_square(self, row, col, player):
+        i = row * BOARD_COLS + col
+        if player == PLAYER_X:
+            self.x_mask |= 1 << i
+        else:
+            self.o_mask |= 1 << i
+        self.marked_squares += 1
+        self.zobrist ^= _ZOBRIST[i][player - 1]
+
+    def undo(self, row, col, player):
+        i = row * BOARD_COLS + col
+        if player == PLAYER_X:
+            self.x_mask &= ~(1 << i)
+        else:
+            self.o_mask &= ~(1 << i)
+        self.marked_squares -= 1
+        self.zobrist ^= _ZOBRIST[i][player - 1]
+
+    def is_square_available(self, row, col):
+        return not ((self.x_mask | self.o_mask) >> (row * BOARD_COLS + col)) & 1
+
+    def is_board_full(self):
+        return self.marked_squares == BOARD_ROWS * BOARD_COLS
+
+    def iter_empty(self):
+        free = ~(self.x_mask | self.o_mask) & 0x1FF
+        while free:
+            lsb = free & -free
+            i = lsb.bit_length() - 1
+            yield (i // BOARD_COLS, i % BOARD_COLS)
+            free ^= lsb
+
+    def get_empty_squares(self):
+        return list(self.iter_empty())
+
+    def check_win(self, player):
+        mask = self.x_mask if player == PLAYER_X else self.o_mask
+        return _check_any_line(mask)
+
+    def check_win_at(self, row, col, player):
+        mask = self.x_mask if player == PLAYER_X else self.o_mask
+        return _WIN_CHECKERS[row * BOARD_COLS + col](mask)
+
+    def get_state(self):
+        return STATE_TABLE[(self.x_mask, self.o_mask)]
+
+
+def _build_state_table():
+    table = {}
+    board = Board()
+
+    def visit(player):
+        for row, col in board.iter_empty():
+            board.mark_square(row, col, player)
+            key = (board.x_mask, board.o_mask)
+            if key not in table:
+                if board.check_win_at(row, col, player):
+                    table[key] = (True, player)
+                elif board.is_board_full():
+                    table[key] = (True, 0)
+                else:
+                    table[key] = (False, 0)
+                    visit(player ^ 3)
+            board.undo(row, col, player)
+
+    table[(0, 0)] = (False, 0)
+    visit(PLAYER_X)
+    return table
+
+
+STATE_TABLE = _build_state_table()